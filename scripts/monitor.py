@@ -5,6 +5,13 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 import yaml
 
+try:
+    import orjson
+except ImportError:  # optional: fallback pe json din stdlib
+    orjson = None
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 ROOT = Path(__file__).resolve().parents[1]
 NEWS_PATH = ROOT / "data" / "news.json"
@@ -16,6 +23,8 @@ CONFIG_PATH = ROOT / "config" / "sources.yml"
 
 def read_json(path: Path) -> Dict[str, Any]:
     try:
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
         return json.loads(path.read_text(encoding="utf-8"))
     except Exception:
         return {}
@@ -23,14 +32,19 @@ def read_json(path: Path) -> Dict[str, Any]:
 
 def read_yaml(path: Path) -> Dict[str, Any]:
     try:
-        return yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        return yaml.load(path.read_bytes(), Loader=YAML_LOADER) or {}
     except Exception:
         return {}
 
 
 def write_json(path: Path, payload: Dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    tmp = path.with_name(path.name + ".tmp")
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+    else:
+        tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    tmp.replace(path)
 
 
 def parse_iso(s: str) -> Optional[datetime]:
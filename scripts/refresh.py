@@ -1,18 +1,36 @@
 # scripts/refresh.py
+import calendar
 import os
+import pickle
 import re
 import json
 import time
 import random
+import shutil
 import hashlib
+import heapq
+import threading
 import unicodedata
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional, Tuple
-from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from html import unescape
+from html.parser import HTMLParser
+from typing import Dict, Any, List, Optional, Set, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
 
 import requests
 import feedparser
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional: fallback pe json din stdlib
+    orjson = None
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 CONFIG_PATH = os.path.join(ROOT_DIR, "config", "sources.yml")
@@ -22,14 +40,45 @@ OUT_ITEMS = os.path.join(ROOT_DIR, "data", "items.json")
 JOKES_PATH = os.path.join(ROOT_DIR, "data", "jokes_ro.txt")
 TOP_IMAGE_STATE_PATH = os.path.join(ROOT_DIR, "data", "top_images_state.json")
 PUBLISHED_STATE_PATH = os.path.join(ROOT_DIR, "data", "published_state.json")
+DEEPL_CACHE_PATH = os.path.join(ROOT_DIR, "data", "deepl_cache.json")
+HTTP_CACHE_DIR = os.path.join(ROOT_DIR, ".cache", "http")
+HTTP_CACHE_KEEP_DAYS = 14
 
 USER_AGENT = "vesti-bune-bot/strict-ro (+https://vcarciu.github.io/vesti-bune/)"
+FETCH_WORKERS = 16
+# Pauza minima intre doua cereri catre acelasi host (mai multe feed-uri stau pe acelasi domeniu).
+HOST_MIN_INTERVAL = 0.2
 SESSION = requests.Session()
 SESSION.headers.update({"User-Agent": USER_AGENT})
+# Feed-urile se descarca in paralel; pool-ul trebuie sa tina pasul cu worker-ii.
+# Erorile tranzitorii (conexiune, 5xx, 429) se reincearca pe aceeasi conexiune keep-alive.
+# Retry-After e ignorat: urllib3 ar dormi cat cere serverul (fara plafon) si ar bloca un worker.
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    ),
+)
+SESSION.mount("https://", _HTTP_ADAPTER)
+SESSION.mount("http://", _HTTP_ADAPTER)
 
 # -----------------------------
 # Utils
 # -----------------------------
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.I | re.S)
+WHITESPACE_RE = re.compile(r"\s+")
+TITLE_LEAD_RE = re.compile(r"^[^a-z0-9]+")
+TITLE_SEPARATOR_RE = re.compile(r"\s*(?:\||-|:)\s+")
+TITLE_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
+TITLE_NOISE_WORDS_RE = re.compile(r"\b(romania|romanian|video|foto|live|update|breaking)\b")
+JOKE_BULLET_RE = re.compile(r"^\s*[-*•]+\s*")
+
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
@@ -37,23 +86,100 @@ def safe_mkdir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 def load_yaml(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=YAML_LOADER) or {}
 
 def strip_html(text: str) -> str:
     if not text:
         return ""
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    if "<" in text:
+        # feed-urile se parseaza fara sanitizarea feedparser: scoatem aici script/style
+        text = SCRIPT_STYLE_RE.sub(" ", text)
+        text = HTML_TAG_RE.sub(" ", text)
+    if "&" in text:
+        # feed-urile WordPress lasa &#8230; / &#8211; / &amp; in rezumate
+        text = unescape(text)
+    text = WHITESPACE_RE.sub(" ", text).strip()
     return text
 
+# Semnele combinate (clasa canonica != 0) au toate code point-uri sub U+20000.
+_STRIP_COMBINING = {cp: None for cp in range(0x20000) if unicodedata.combining(chr(cp))}
+
+def _fold_diacritics(s: str) -> str:
+    return unicodedata.normalize("NFKD", s).translate(_STRIP_COMBINING)
+
+# Diacriticele latine (ă, î, ș, ț, é, ü, ...) pre-calculate o singura data; in text se
+# inlocuiesc doar caracterele non-ASCII distincte, fara NFKD pe fiecare articol.
+_FOLD_MAP = {
+    chr(cp): _fold_diacritics(chr(cp))
+    for cp in (*range(0x80, 0x250), *range(0x1E00, 0x1F00))
+    if _fold_diacritics(chr(cp)) != chr(cp)
+}
+NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+@lru_cache(maxsize=4096)
 def normalize_text(s: str) -> str:
+    # Memoizat: acelasi titlu/text revine in dedupe, fallback-ul RO relaxat si mix.
     s = (s or "").lower()
-    s = unicodedata.normalize("NFKD", s)
-    s = "".join(ch for ch in s if not unicodedata.combining(ch))
-    s = re.sub(r"\s+", " ", s).strip()
+    if not s.isascii():
+        for ch in set(NON_ASCII_RE.findall(s)):
+            repl = _FOLD_MAP.get(ch)
+            if repl is not None:
+                s = s.replace(ch, repl)
+        if not s.isascii():
+            # alte scripturi / semne combinate separat: calea completa NFKD
+            s = _fold_diacritics(s)
+    s = WHITESPACE_RE.sub(" ", s).strip()
     return s
 
+def _mk_norm_list(words: List[str]) -> List[str]:
+    # Cuvintele goale se elimina aici, o singura data, ca buclele de matching sa nu mai verifice `if kw`.
+    return [nx for nx in (normalize_text(x) for x in words if (x or "").strip()) if nx]
+
+def _trie_pattern(words: List[str]) -> str:
+    trie: Dict[str, Any] = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def emit(node: Dict[str, Any]) -> str:
+        alts = [re.escape(ch) + emit(sub) for ch, sub in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        # Extensia e optionala si greedy: la fiecare pozitie se prinde cel mai lung cuvant.
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+class KeywordMatcher:
+    """
+    Gaseste toate cuvintele-cheie dintr-o lista intr-o singura trecere peste text.
+    Lista e compilata ca trie intr-un singur regex (acelasi rezultat ca un automat
+    Aho-Corasick, fara dependinte noi); un cuvant gasit le implica si pe cele
+    continute in el ("adoptie" -> "adopt"), deci rezultatul e identic cu
+    `{kw for kw in words if kw in text}`.
+    """
+    __slots__ = ("words", "_re", "_contained")
+
+    def __init__(self, words: List[str]) -> None:
+        self.words = list(words)
+        uniq = sorted(set(self.words))
+        self._contained = {w: tuple(x for x in uniq if x in w) for w in uniq}
+        self._re = re.compile("(?=(" + _trie_pattern(uniq) + "))") if uniq else None
+
+    def matches(self, text: str) -> bool:
+        return bool(self._re and self._re.search(text))
+
+    def found(self, text: str) -> Set[str]:
+        out: Set[str] = set()
+        if self._re:
+            for m in self._re.finditer(text):
+                out.update(self._contained[m.group(1)])
+        return out
+
 def normalized_title_key(title: str) -> str:
     """
     Normalizeaza titlurile agresiv pentru deduplicare intre surse:
@@ -61,11 +187,11 @@ def normalized_title_key(title: str) -> str:
     " - ", " | ", ":" folositi frecvent in feed-uri.
     """
     text = normalize_text(title)
-    text = re.sub(r"^[^a-z0-9]+", "", text)
-    text = re.sub(r"\s*(?:\||-|:)\s+", " ", text)
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-    text = re.sub(r"\b(romania|romanian|video|foto|live|update|breaking)\b", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = TITLE_LEAD_RE.sub("", text)
+    text = TITLE_SEPARATOR_RE.sub(" ", text)
+    text = TITLE_NON_ALNUM_RE.sub(" ", text)
+    text = TITLE_NOISE_WORDS_RE.sub(" ", text)
+    text = WHITESPACE_RE.sub(" ", text).strip()
     return text
 
 def parse_entry_datetime(entry: Dict[str, Any]) -> Optional[datetime]:
@@ -73,7 +199,8 @@ def parse_entry_datetime(entry: Dict[str, Any]) -> Optional[datetime]:
         t = entry.get(key)
         if t:
             try:
-                return datetime.fromtimestamp(time.mktime(t), tz=timezone.utc)
+                # feedparser da *_parsed deja in UTC; mktime l-ar interpreta ca ora locala
+                return datetime.fromtimestamp(calendar.timegm(t), tz=timezone.utc)
             except Exception:
                 pass
     return None
@@ -101,39 +228,63 @@ def get_entry_summary(entry: Dict[str, Any]) -> str:
         return strip_html(val)
     return ""
 
+@lru_cache(maxsize=4096)
 def canonicalize_url(url: str) -> str:
     """
-    Reduce duplicatele: scoate tracking params (utm_*, fbclid, gclid etc.)
+    Reduce duplicatele: scoate tracking params (utm_*, fbclid, gclid etc.),
+    fragmentul si diferentele de majuscule din host.
     """
     try:
         parts = urlsplit(url)
-        q = parse_qsl(parts.query, keep_blank_values=True)
-        drop_prefixes = ("utm_",)
-        drop_keys = {"fbclid", "gclid", "yclid", "mc_cid", "mc_eid", "cmpid"}
-        q2 = [(k, v) for (k, v) in q if not k.lower().startswith(drop_prefixes) and k.lower() not in drop_keys]
-        new_query = urlencode(q2, doseq=True)
-        clean = urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip("/"), new_query, ""))  # drop fragment
+        new_query = ""
+        if parts.query:
+            q = parse_qsl(parts.query, keep_blank_values=True)
+            drop_prefixes = ("utm_",)
+            drop_keys = {"fbclid", "gclid", "yclid", "mc_cid", "mc_eid", "cmpid"}
+            q2 = [(k, v) for (k, v) in q if not k.lower().startswith(drop_prefixes) and k.lower() not in drop_keys]
+            new_query = urlencode(q2, doseq=True)
+        clean = urlunsplit((parts.scheme, parts.netloc.lower(), parts.path.rstrip("/"), new_query, ""))  # drop fragment
         return clean
     except Exception:
         return url
 
 def dedupe_key(link: str, title: str) -> str:
     base = canonicalize_url(link or "") + "||" + (title or "")
-    return hashlib.sha1(base.encode("utf-8", errors="ignore")).hexdigest()
+    # Cheie de deduplicare, nu semnatura: blake2b (C, in stdlib) e mai rapid decat SHA-1.
+    return hashlib.blake2b(base.encode("utf-8", errors="ignore"), digest_size=16).hexdigest()
+
+def stable_index(seed: str, n: int) -> int:
+    """
+    Index determinist in [0, n) derivat din `seed` (ex. ziua curenta).
+    """
+    digest = hashlib.blake2s(seed.encode("utf-8", errors="ignore"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % max(1, n)
 
 def write_json(path: str, payload: Dict[str, Any]) -> None:
+    # Scriere atomica: fisier temporar + os.replace, ca o rulare intrerupta sa nu lase JSON trunchiat.
     safe_mkdir(os.path.dirname(path))
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
+    tmp = path + ".tmp"
+    if orjson is not None:
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
 
 def read_json(path: str) -> Dict[str, Any]:
     try:
+        if orjson is not None:
+            with open(path, "rb") as f:
+                return orjson.loads(f.read()) or {}
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f) or {}
     except Exception:
         return {}
 
+@lru_cache(maxsize=8192)
 def parse_iso_datetime(s: str) -> Optional[datetime]:
+    # Starea de publicare are multe marcaje identice (un timestamp per rulare).
     return parse_iso_datetime_safe(s)
 
 def load_published_state(path: str = PUBLISHED_STATE_PATH) -> Dict[str, Dict[str, str]]:
@@ -209,35 +360,269 @@ def compute_freshness_boost(published: datetime, now_utc: datetime, cfg: Dict[st
 # -----------------------------
 # HTTP / RSS
 # -----------------------------
+def _http_cache_paths(url: str) -> Tuple[str, str]:
+    h = hashlib.sha1(url.encode("utf-8", errors="ignore")).hexdigest()
+    return os.path.join(HTTP_CACHE_DIR, f"{h}.json"), os.path.join(HTTP_CACHE_DIR, f"{h}.body")
+
+_HOST_LOCKS: Dict[str, threading.Lock] = {}
+_HOST_LAST: Dict[str, float] = {}
+
+def _wait_for_host(url: str) -> None:
+    """Serializeaza pornirea cererilor pe acelasi host, la cel putin HOST_MIN_INTERVAL distanta."""
+    host = urlsplit(url).netloc.lower()
+    lock = _HOST_LOCKS.setdefault(host, threading.Lock())
+    with lock:
+        wait = _HOST_LAST.get(host, 0.0) + HOST_MIN_INTERVAL - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _HOST_LAST[host] = time.monotonic()
+
+def http_get_cached(url: str, timeout: int = 25) -> Tuple[Optional[bytes], Optional[str], Optional[str]]:
+    """
+    GET conditionat: trimite If-None-Match / If-Modified-Since salvate la rularea
+    anterioara; la 304 refoloseste corpul din .cache/http fara sa-l mai descarce.
+    Intoarce (content, final_url, encoding) sau (None, None, None).
+    """
+    meta_path, body_path = _http_cache_paths(url)
+    meta = read_json(meta_path) if os.path.exists(body_path) else {}
+    headers: Dict[str, str] = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    _wait_for_host(url)
+    r = SESSION.get(url, timeout=timeout, allow_redirects=True, headers=headers)
+    if r.status_code == 304 and headers:
+        with open(body_path, "rb") as f:
+            body = f.read()
+        meta["checked_utc"] = utc_now_iso()
+        write_json(meta_path, meta)
+        return body, meta.get("final_url") or url, meta.get("encoding")
+    if r.status_code != 200:
+        return None, None, None
+
+    etag = (r.headers.get("ETag") or "").strip()
+    last_modified = (r.headers.get("Last-Modified") or "").strip()
+    if (etag or last_modified) and r.content:
+        try:
+            safe_mkdir(HTTP_CACHE_DIR)
+            with open(body_path, "wb") as f:
+                f.write(r.content)
+            write_json(meta_path, {
+                "url": url,
+                "final_url": r.url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "encoding": r.encoding,
+                "checked_utc": utc_now_iso(),
+            })
+        except OSError:
+            pass
+    return r.content, r.url, r.encoding
+
+def prune_http_cache(keep_days: int = HTTP_CACHE_KEEP_DAYS) -> None:
+    if not os.path.isdir(HTTP_CACHE_DIR):
+        return
+    now = datetime.now(timezone.utc)
+    for name in os.listdir(HTTP_CACHE_DIR):
+        if not name.endswith(".json"):
+            continue
+        meta_path = os.path.join(HTTP_CACHE_DIR, name)
+        dt = parse_iso_datetime((read_json(meta_path).get("checked_utc") or "").strip())
+        if dt and (now - dt).days <= keep_days:
+            continue
+        base = meta_path[: -len(".json")]
+        for path in (meta_path, base + ".body", base + ".feed"):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
 def fetch_url_with_final(url: str) -> Tuple[Optional[str], Optional[str]]:
     try:
-        r = SESSION.get(url, timeout=25, allow_redirects=True)
-        if r.status_code == 200 and r.text:
-            return r.text, r.url
+        body, final_url, encoding = http_get_cached(url)
+        if body:
+            return body.decode(encoding or "utf-8", errors="replace"), final_url
     except Exception:
         return None, None
     return None, None
 
+def _parsed_feed_path(url: str) -> str:
+    meta_path, _body_path = _http_cache_paths(url)
+    return meta_path[: -len(".json")] + ".feed"
+
+def _load_parsed_feed(url: str, body: bytes) -> Optional[feedparser.FeedParserDict]:
+    """
+    Daca feed-ul n-a cerut nimic nou (304 / acelasi continut), refoloseste rezultatul
+    feedparser salvat la rularea anterioara in loc sa reparseze XML-ul.
+    """
+    path = _parsed_feed_path(url)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            digest, feed = pickle.load(f)
+    except Exception:
+        return None
+    if digest != hashlib.blake2b(body, digest_size=16).digest():
+        return None
+    return feed
+
+def _store_parsed_feed(url: str, body: bytes, feed: feedparser.FeedParserDict) -> None:
+    # Doar feed-urile cu ETag/Last-Modified au corpul in cache, deci pot primi 304.
+    _meta_path, body_path = _http_cache_paths(url)
+    if not os.path.exists(body_path):
+        return
+    path = _parsed_feed_path(url)
+    try:
+        with open(path, "wb") as f:
+            pickle.dump((hashlib.blake2b(body, digest_size=16).digest(), feed), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+# Feed-urile descarcate in rularea curenta: build_sections (inclusiv reincercarea fara
+# cooldown) si build_satire citesc acelasi feed o singura data.
+_RSS_MEMO: Dict[str, feedparser.FeedParserDict] = {}
+
 def fetch_rss(url: str) -> feedparser.FeedParserDict:
+    cached = _RSS_MEMO.get(url)
+    if cached is not None:
+        return cached
     try:
-        r = SESSION.get(url, timeout=25, allow_redirects=True)
-        if r.status_code != 200:
+        body, _final_url, _encoding = http_get_cached(url)
+        if body is None:
             return feedparser.FeedParserDict(entries=[])
-        return feedparser.parse(r.content)
+        feed = _load_parsed_feed(url, body)
+        if feed is None:
+            # Citim doar campuri simple si curatam singuri HTML-ul din rezumate, deci
+            # sanitizarea si rezolvarea URI-urilor relative din feedparser sunt munca in plus.
+            feed = feedparser.parse(body, sanitize_html=False, resolve_relative_uris=False)
+            _store_parsed_feed(url, body, feed)
     except Exception:
         return feedparser.FeedParserDict(entries=[])
+    _RSS_MEMO[url] = feed
+    return feed
+
+def fetch_rss_many(urls: List[str]) -> Dict[str, feedparser.FeedParserDict]:
+    """
+    Descarca feed-urile in paralel (timpul total ~ cel mai lent feed, nu suma lor).
+    Intoarce {url: feed}; URL-urile duplicate se descarca o singura data.
+    """
+    unique = list(dict.fromkeys(u for u in urls if u))
+    if not unique:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(unique))) as ex:
+        return dict(zip(unique, ex.map(fetch_rss, unique)))
 
 # -----------------------------
 # DeepL (optional)
 # -----------------------------
-def deepl_translate(text: str, target_lang: str = "RO") -> Optional[str]:
+def _deepl_cache_key(text: str, target_lang: str) -> str:
+    return hashlib.sha1(f"{target_lang}|{text}".encode("utf-8", errors="ignore")).hexdigest()
+
+def load_translation_cache(path: str = DEEPL_CACHE_PATH) -> Dict[str, Dict[str, Any]]:
+    raw = read_json(path)
+    entries = raw.get("entries") if isinstance(raw, dict) else {}
+    if not isinstance(entries, dict):
+        entries = {}
+    return {"entries": entries}
+
+def prune_translation_cache(cache: Dict[str, Dict[str, Any]], keep_days: int = 30, max_entries: int = 20000) -> Dict[str, Dict[str, Any]]:
+    now = datetime.now(timezone.utc)
+    kept: List[Tuple[datetime, str, Dict[str, str]]] = []
+    for k, row in (cache.get("entries") or {}).items():
+        if not isinstance(k, str) or not isinstance(row, dict):
+            continue
+        dt = parse_iso_datetime((row.get("used_utc") or "").strip())
+        if not dt or (now - dt).days > keep_days:
+            continue
+        kept.append((dt, k, row))
+    kept.sort(key=lambda x: x[0], reverse=True)
+    return {"entries": {k: row for _dt, k, row in kept[:max_entries]}}
+
+DEEPL_MAX_TEXTS = 50
+DEEPL_MAX_BYTES = 120 * 1024
+DEEPL_MAX_ATTEMPTS = 4
+DEEPL_MAX_BACKOFF = 30.0
+
+def _deepl_batches(pending: List[Tuple[int, str, str]]) -> List[List[Tuple[int, str, str]]]:
+    """
+    Imparte textele in loturi de cel mult DEEPL_MAX_TEXTS texte si ~DEEPL_MAX_BYTES
+    per request (limitele DeepL pentru un singur POST).
+    """
+    batches: List[List[Tuple[int, str, str]]] = []
+    cur: List[Tuple[int, str, str]] = []
+    size = 0
+    for row in pending:
+        n = len(row[1].encode("utf-8"))
+        if cur and (len(cur) >= DEEPL_MAX_TEXTS or size + n > DEEPL_MAX_BYTES):
+            batches.append(cur)
+            cur, size = [], 0
+        cur.append(row)
+        size += n
+    if cur:
+        batches.append(cur)
+    return batches
+
+def _deepl_post(url: str, data: List[Tuple[str, str]]) -> requests.Response:
+    """
+    POST catre DeepL cu reincercari la 429 / 5xx: asteapta Retry-After daca e trimis,
+    altfel backoff exponential cu jitter. 456 (cota depasita) nu se reincearca.
+    """
+    for attempt in range(DEEPL_MAX_ATTEMPTS):
+        r = SESSION.post(url, data=data, timeout=25)
+        if r.status_code != 429 and r.status_code < 500:
+            return r
+        if attempt + 1 >= DEEPL_MAX_ATTEMPTS:
+            break
+        try:
+            delay = float(r.headers.get("Retry-After") or "")
+        except ValueError:
+            delay = 2 ** attempt
+        time.sleep(min(DEEPL_MAX_BACKOFF, delay) + random.random())
+    return r
+
+def deepl_translate_many(
+    texts: List[str],
+    target_lang: str = "RO",
+    cache: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> List[Optional[str]]:
+    """
+    Traduce mai multe texte cu cat mai putine POST-uri (DeepL accepta parametrul `text`
+    repetat, pana la 50 per request, si intoarce traducerile in aceeasi ordine).
+    Textele deja traduse in rulari anterioare se iau din cache si nu mai ajung la API.
+    """
+    out: List[Optional[str]] = [None] * len(texts)
     key = os.getenv("DEEPL_API_KEY", "").strip()
-    if not key or not (text or "").strip():
-        return None
+    if not key:
+        return out
 
-    text = text.strip()
-    if len(text) > 900:
-        text = text[:900]
+    entries = cache.setdefault("entries", {}) if cache is not None else {}
+    now_iso = utc_now_iso()
+    pending: List[Tuple[int, str, str]] = []
+    # textele identice (ex. acelasi rezumat la doua surse) se trimit o singura data
+    repeats: Dict[str, List[int]] = {}
+    for i, raw in enumerate(texts):
+        text = (raw or "").strip()[:900]
+        if not text:
+            continue
+        ck = _deepl_cache_key(text, target_lang)
+        hit = entries.get(ck)
+        if isinstance(hit, dict) and (hit.get("text") or "").strip():
+            hit["used_utc"] = now_iso
+            out[i] = hit["text"]
+            continue
+        if ck in repeats:
+            repeats[ck].append(i)
+            continue
+        repeats[ck] = []
+        pending.append((i, text, ck))
+    if not pending:
+        return out
 
     url_env = os.getenv("DEEPL_API_URL", "").strip()
     candidates = [url_env] if url_env else [
@@ -245,36 +630,108 @@ def deepl_translate(text: str, target_lang: str = "RO") -> Optional[str]:
         "https://api.deepl.com/v2/translate",
     ]
 
-    data = {"auth_key": key, "text": text, "target_lang": target_lang}
+    urls = [u for u in candidates if u]
+    for batch in _deepl_batches(pending):
+        data = [("auth_key", key), ("target_lang", target_lang)] + [("text", text) for _i, text, _ck in batch]
+        for url in list(urls):
+            try:
+                r = _deepl_post(url, data)
+                if r.status_code != 200:
+                    continue
+                tr = r.json().get("translations", [])
+                if len(tr) != len(batch):
+                    continue
+                for (i, _text, ck), row in zip(batch, tr):
+                    val = (row.get("text") or "").strip()
+                    if val:
+                        out[i] = val
+                        entries[ck] = {"text": val, "used_utc": now_iso}
+                # endpoint-ul care a raspuns (free/pro) se incearca primul la urmatorul batch
+                urls.remove(url)
+                urls.insert(0, url)
+                break
+            except Exception:
+                continue
+    for i, _text, ck in pending:
+        for j in repeats[ck]:
+            out[j] = out[i]
+    return out
 
-    for url in [u for u in candidates if u]:
-        try:
-            r = requests.post(url, data=data, timeout=25, headers={"User-Agent": USER_AGENT})
-            if r.status_code == 200:
-                js = r.json()
-                tr = js.get("translations", [])
-                if tr:
-                    out = (tr[0].get("text") or "").strip()
-                    return out or None
-        except Exception:
-            continue
-    return None
+def translate_global_items(items: List[Dict[str, Any]], cache: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+    todo = [it for it in items if it.get("kind") == "global"]
+    if not todo:
+        return
+    texts: List[str] = []
+    for it in todo:
+        texts.extend([it.get("title") or "", it.get("summary") or ""])
+    translated = deepl_translate_many(texts, cache=cache)
+    for n, it in enumerate(todo):
+        tr_title, tr_sum = translated[2 * n], translated[2 * n + 1]
+        if tr_title:
+            it["title_ro"] = tr_title
+        if tr_sum:
+            it["summary_ro"] = tr_sum
 
 # -----------------------------
 # Images (RSS + og:image)
 # -----------------------------
-OG_IMAGE_RE_1 = re.compile(r'property=["\']og:image["\']\s+content=["\']([^"\']+)["\']', re.I)
-OG_IMAGE_RE_2 = re.compile(r'content=["\']([^"\']+)["\']\s+property=["\']og:image["\']', re.I)
+HEAD_END_RE = re.compile(r"</head\s*>", re.I)
 IMG_SRC_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.I)
 PROMO_TAG_RE = re.compile(r'(^|\W)\(p\)(\W|$)', re.I)
 
-def extract_og_image(html: str) -> Optional[str]:
+class _HeadMetaParser(HTMLParser):
+    """
+    Colecteaza <meta property|name|itemprop=... content=...> din <head>,
+    indiferent de ordinea atributelor; entitatile (&amp;) sunt decodate.
+    """
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.meta: Dict[str, str] = {}
+        self.in_body = False
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "body":
+            self.in_body = True
+        if self.in_body or tag != "meta":
+            return
+        a = dict(attrs)
+        key = (a.get("property") or a.get("name") or a.get("itemprop") or "").strip().lower()
+        content = (a.get("content") or "").strip()
+        if key and content:
+            self.meta.setdefault(key, content)
+
+def parse_page_meta(html: str) -> Dict[str, str]:
+    """
+    Parseaza o singura data head-ul paginii si intoarce meta-urile {cheie: content}.
+    """
     if not html:
+        return {}
+    m = HEAD_END_RE.search(html)
+    parser = _HeadMetaParser()
+    try:
+        parser.feed(html[: m.end()] if m else html)
+        parser.close()
+    except Exception:
+        pass
+    return parser.meta
+
+def extract_og_image(html: str) -> Optional[str]:
+    return parse_page_meta(html).get("og:image") or None
+
+UNSAFE_URL_CHARS_RE = re.compile(r"[\"'<>\s]")
+
+def safe_http_url(url: str) -> Optional[str]:
+    """
+    URL-ul ajunge nescapat intr-un atribut din index.html: acceptam doar http(s),
+    fara ghilimele, paranteze unghiulare sau spatii (nici dupa decodarea entitatilor).
+    """
+    if not url or UNSAFE_URL_CHARS_RE.search(url):
         return None
-    m = OG_IMAGE_RE_1.search(html) or OG_IMAGE_RE_2.search(html)
-    if m:
-        return (m.group(1) or "").strip() or None
-    return None
+    if "&" in url and UNSAFE_URL_CHARS_RE.search(unescape(url)):
+        return None
+    if urlsplit(url).scheme.lower() not in ("http", "https"):
+        return None
+    return url
 
 def extract_image_url(e: dict, allow_page_fetch: bool = False) -> Optional[str]:
     mc = e.get("media_content")
@@ -282,14 +739,14 @@ def extract_image_url(e: dict, allow_page_fetch: bool = False) -> Optional[str]:
         for item in mc:
             url = (item.get("url") or "").strip()
             if url:
-                return url
+                return safe_http_url(url)
 
     mt = e.get("media_thumbnail")
     if isinstance(mt, list) and mt:
         for item in mt:
             url = (item.get("url") or "").strip()
             if url:
-                return url
+                return safe_http_url(url)
 
     links = e.get("links")
     if isinstance(links, list):
@@ -297,20 +754,23 @@ def extract_image_url(e: dict, allow_page_fetch: bool = False) -> Optional[str]:
             rel = (l.get("rel") or "").lower()
             href = (l.get("href") or "").strip()
             if rel == "enclosure" and href:
-                return href
+                return safe_http_url(href)
 
     html = e.get("summary") or ""
-    if isinstance(html, str) and html:
+    # fara niciun tag, regex-ul (case-insensitive) n-are ce gasi
+    if isinstance(html, str) and "<" in html:
         m = IMG_SRC_RE.search(html)
         if m:
-            return (m.group(1) or "").strip() or None
+            # src ramane codat ca in feed; entitatile se decodeaza doar in strip_html
+            src = (m.group(1) or "").strip()
+            return safe_http_url(urljoin(e.get("link") or "", src)) if src else None
 
     link = (e.get("link") or "").strip()
     if allow_page_fetch and link:
         page_html, _final = fetch_url_with_final(link)
         img = extract_og_image(page_html or "")
         if img:
-            return img.strip()
+            return safe_http_url(img.strip())
 
     return None
 
@@ -326,48 +786,54 @@ def is_valid_image_url(url: str) -> bool:
         return True
     return ("staticflickr.com/" in u) or ("upload.wikimedia.org/" in u)
 
-def is_top_photo_candidate(tag: str, title: str, summary: str, link: str) -> bool:
-    text = normalize_text(f"{title} {summary} {link}")
-    if tag == "space":
-        good = _mk_norm_list(["space", "astronomy", "nebula", "galaxy", "milky way", "nasa", "telescope", "star"])
-        bad = _mk_norm_list([
+TOP_PHOTO_KEYWORDS: Dict[str, Tuple[List[str], List[str]]] = {
+    "space": (
+        _mk_norm_list(["space", "astronomy", "nebula", "galaxy", "milky way", "nasa", "telescope", "star"]),
+        _mk_norm_list([
             "office", "cowork", "workspace", "interior", "meeting room", "desk",
             "people", "person", "portrait", "human", "man", "woman", "child",
             "car", "vehicle", "truck", "motorcycle", "bike", "bicycle", "road", "street",
-        ])
-        return any(k in text for k in good) and not any(k in text for k in bad)
-    if tag == "landscape":
-        bad_animals = _mk_norm_list(["cat", "dog", "bird", "eagle", "hawk", "tiger", "lion", "wolf", "fox", "bear", "animal"])
-        good_land = _mk_norm_list(["landscape", "nature", "mountain", "valley", "forest", "lake", "river", "sunset", "sunrise", "waterfall"])
-        return any(k in text for k in good_land) and not any(k in text for k in bad_animals)
-    if tag == "animals":
-        good_animals = _mk_norm_list([
+        ]),
+    ),
+    "landscape": (
+        _mk_norm_list(["landscape", "nature", "mountain", "valley", "forest", "lake", "river", "sunset", "sunrise", "waterfall"]),
+        _mk_norm_list(["cat", "dog", "bird", "eagle", "hawk", "tiger", "lion", "wolf", "fox", "bear", "animal"]),
+    ),
+    "animals": (
+        _mk_norm_list([
             "animal", "animals", "wildlife", "mammal", "bird", "cat", "dog", "fox", "wolf", "bear",
             "lion", "tiger", "elephant", "deer", "otter", "seal", "whale", "dolphin", "owl", "eagle",
             "toucan", "penguin", "koala", "panda"
-        ])
-        bad = _mk_norm_list([
+        ]),
+        _mk_norm_list([
             "space", "astronomy", "nebula", "galaxy", "planet", "milky way",
             "landscape", "mountain", "valley", "city", "urban", "architecture", "skyline",
-        ])
-        return any(k in text for k in good_animals) and not any(k in text for k in bad)
-    if tag == "humans":
-        bad = _mk_norm_list(["nude", "lingerie", "swimwear", "bikini", "nsfw", "erotic"])
-        return not any(k in text for k in bad)
-    if tag == "cities":
-        good = _mk_norm_list(["city", "urban", "street", "skyline", "architecture", "night city"])
-        bad = _mk_norm_list([
+        ]),
+    ),
+    "cities": (
+        _mk_norm_list(["city", "urban", "street", "skyline", "architecture", "night city"]),
+        _mk_norm_list([
             "animal", "cat", "dog", "bird",
             "car", "cars", "vehicle", "vehicles", "truck", "automobile", "road",
             "honda", "toyota", "bmw", "audi", "mercedes", "fiat",
             "sedan", "suv", "turbo", "engine", "motor",
-        ])
-        return any(k in text for k in good) and not any(k in text for k in bad)
-    if tag == "microcosmos":
-        good = _mk_norm_list(["microscopy", "micrograph", "microscopic", "cell", "bacteria", "amoeba", "plankton"])
-        bad = _mk_norm_list(["mountain", "landscape", "city", "street", "skyline", "forest", "lake"])
-        return any(k in text for k in good) and not any(k in text for k in bad)
-    return True
+        ]),
+    ),
+    "microcosmos": (
+        _mk_norm_list(["microscopy", "micrograph", "microscopic", "cell", "bacteria", "amoeba", "plankton"]),
+        _mk_norm_list(["mountain", "landscape", "city", "street", "skyline", "forest", "lake"]),
+    ),
+}
+TOP_PHOTO_HUMANS_BLOCK = _mk_norm_list(["nude", "lingerie", "swimwear", "bikini", "nsfw", "erotic"])
+
+def is_top_photo_candidate(tag: str, title: str, summary: str, link: str) -> bool:
+    text = normalize_text(f"{title} {summary} {link}")
+    if tag == "humans":
+        return not any(k in text for k in TOP_PHOTO_HUMANS_BLOCK)
+    if tag not in TOP_PHOTO_KEYWORDS:
+        return True
+    good, bad = TOP_PHOTO_KEYWORDS[tag]
+    return any(k in text for k in good) and not any(k in text for k in bad)
 
 def fallback_image_url(section_id: str, title: str, link: str) -> str:
     """
@@ -380,9 +846,6 @@ def fallback_image_url(section_id: str, title: str, link: str) -> str:
 # -----------------------------
 # Filtering (RO)
 # -----------------------------
-def _mk_norm_list(words: List[str]) -> List[str]:
-    return [normalize_text(x) for x in words if (x or "").strip()]
-
 RAW_RO_HARD_BLOCK = [
     # politică / geo-politică / război (ex: UE + Ucraina)
     "scandal", "ue", "uniunea europeana", "uniunea europeană",
@@ -505,6 +968,9 @@ RAW_RO_POSITIVE_HINTS_RELAXED = [
     "voluntar", "copii", "familie", "tabara", "tabără", "parc", "atelier", "biblioteca", "bibliotecă",
 ]
 RO_POSITIVE_HINTS_RELAXED = _mk_norm_list(RAW_RO_POSITIVE_HINTS_RELAXED)
+RO_HARD_BLOCK_MATCHER = KeywordMatcher(RO_HARD_BLOCK)
+RO_LOW_SIGNAL_MATCHER = KeywordMatcher(RO_LOW_SIGNAL_BLOCK)
+RO_POSITIVE_MATCHER = KeywordMatcher(RO_POSITIVE_HINTS_STRICT + RO_POSITIVE_HINTS_RELAXED)
 MAINSTREAM_RO_SOURCES = {"Digi24", "HotNews"}
 CURATED_RO_SOURCES = {
     "Start-Up Romania",
@@ -556,29 +1022,50 @@ RO_MAINSTREAM_POSITIVE_GATE = _mk_norm_list([
     "salvamont", "interventie reusita", "intervenție reușită", "copil salvat", "persoana salvata", "persoană salvată",
 ])
 
-def ro_hard_block(title: str, summary: str) -> bool:
-    text = normalize_text(f"{title} {summary}")
-    return any(kw in text for kw in RO_HARD_BLOCK if kw)
+RO_MAINSTREAM_CIVIC_BLOCK = _mk_norm_list([
+    "audit extern", "consiliul general", "termoenergetica", "stb",
+    "compania municipala", "compania municipală", "cgtmb",
+])
+RO_TECH_COMMERCIAL_BLOCK = _mk_norm_list([
+    "test de cultura generala", "test de cultură generală",
+    "nvidia", "dlss", "rtx", "sonos", "samsung",
+    "boxe noi", "tehnologia siliciu carbon", "tehnologia siliciu-carbon",
+])
+RO_SOURCE_NATIVE_BLOCK = _mk_norm_list([
+    "angajam", "angajeaza", "angajează", "job", "joburi", "candidatur", "inscrieri", "înscrieri",
+    "calendar", "webinar", "apel deschis", "apel pentru",
+    "mihaela pene", "mihaela penes",
+    "corporate fundraiser", "fundraiser", "ingrijitor", "îngrijitor", "pozitia oficiala", "poziția oficială",
+])
+SATIRE_RO_BLOCK = _mk_norm_list([
+    "iran", "iranieni", "bombard", "rusia", "ucraina", "zelenski", "putin",
+    "motorina", "motorină", "geografie",
+])
+RO_MAINSTREAM_GATE_MATCHER = KeywordMatcher(RO_MAINSTREAM_POSITIVE_GATE)
 
-def ro_low_signal_block(title: str, summary: str, source_name: str = "") -> bool:
-    text = normalize_text(f"{title} {summary}")
+def entry_text(title: str, summary: str, norm: Optional[str] = None) -> str:
+    """
+    Textul normalizat al unui articol; `norm` e valoarea deja calculata in
+    build_sections, ca filtrele succesive sa nu refaca normalizarea.
+    """
+    return norm if norm is not None else normalize_text(f"{title} {summary}")
+
+def ro_hard_block(title: str, summary: str, norm: Optional[str] = None) -> bool:
+    text = entry_text(title, summary, norm)
+    return RO_HARD_BLOCK_MATCHER.matches(text)
+
+def ro_low_signal_block(title: str, summary: str, source_name: str = "", norm: Optional[str] = None) -> bool:
+    text = entry_text(title, summary, norm)
     source = normalize_text(source_name)
-    if any(kw in text for kw in RO_LOW_SIGNAL_BLOCK if kw):
+    if RO_LOW_SIGNAL_MATCHER.matches(text):
         return True
     if any(tag in source for tag in ("digi24", "hotnews")):
-        if any(kw in text for kw in _mk_norm_list([
-            "audit extern", "consiliul general", "termoenergetica", "stb",
-            "compania municipala", "compania municipală", "cgtmb",
-        ])):
+        if any(kw in text for kw in RO_MAINSTREAM_CIVIC_BLOCK):
             return True
     if "cancero" in text and any(tag in source for tag in ("descopera", "life.ro", "b365")):
         return True
     if any(tag in source for tag in ("descopera", "start-up", "startup")):
-        if any(kw in text for kw in _mk_norm_list([
-            "test de cultura generala", "test de cultură generală",
-            "nvidia", "dlss", "rtx", "sonos", "samsung",
-            "boxe noi", "tehnologia siliciu carbon", "tehnologia siliciu-carbon",
-        ])):
+        if any(kw in text for kw in RO_TECH_COMMERCIAL_BLOCK):
             return True
     # Blocheaza review-urile comerciale si "ce functii..." pe surse tech/lifestyle,
     # fara sa taiem stirile despre startup-uri sau inovatie reala.
@@ -591,62 +1078,46 @@ def ro_low_signal_block(title: str, summary: str, source_name: str = "") -> bool
             return True
     return False
 
-def ro_allow(title: str, summary: str, relaxed: bool = False) -> bool:
-    if ro_hard_block(title, summary):
+def ro_allow(title: str, summary: str, relaxed: bool = False, norm: Optional[str] = None) -> bool:
+    text = entry_text(title, summary, norm)
+    if ro_hard_block(title, summary, norm=text):
         return False
 
-    text = normalize_text(f"{title} {summary}")
-
-    for kw in RO_POSITIVE_HINTS_STRICT:
-        if kw and kw in text:
-            return True
-
+    found = RO_POSITIVE_MATCHER.found(text)
+    if any(kw in found for kw in RO_POSITIVE_HINTS_STRICT):
+        return True
     if not relaxed:
         return False
+    return any(kw in found for kw in RO_POSITIVE_HINTS_RELAXED)
 
-    for kw in RO_POSITIVE_HINTS_RELAXED:
-        if kw and kw in text:
-            return True
-
-    return False
-
-def ro_curated_allow(title: str, summary: str) -> bool:
-    if ro_hard_block(title, summary):
+def ro_curated_allow(title: str, summary: str, norm: Optional[str] = None) -> bool:
+    text = entry_text(title, summary, norm)
+    if ro_hard_block(title, summary, norm=text):
         return False
-    return ro_positive_hits(title, summary, relaxed=True) >= 1
+    return ro_positive_hits(title, summary, relaxed=True, norm=text) >= 1
 
-def ro_source_native_allow(title: str, summary: str) -> bool:
-    if ro_hard_block(title, summary):
+def ro_source_native_allow(title: str, summary: str, norm: Optional[str] = None) -> bool:
+    text = entry_text(title, summary, norm)
+    if ro_hard_block(title, summary, norm=text):
         return False
-    text = normalize_text(f"{title} {summary}")
-    blocked = _mk_norm_list([
-        "angajam", "angajeaza", "angajează", "job", "joburi", "candidatur", "inscrieri", "înscrieri",
-        "calendar", "webinar", "apel deschis", "apel pentru",
-        "mihaela pene", "mihaela penes",
-        "corporate fundraiser", "fundraiser", "ingrijitor", "îngrijitor", "pozitia oficiala", "poziția oficială",
-    ])
-    if any(kw in text for kw in blocked):
+    if any(kw in text for kw in RO_SOURCE_NATIVE_BLOCK):
         return False
-    return ro_positive_hits(title, summary, relaxed=True) >= 1
+    return ro_positive_hits(title, summary, relaxed=True, norm=text) >= 1
 
-def satire_ro_allow(title: str, summary: str) -> bool:
-    text = normalize_text(f"{title} {summary}")
-    blocked = _mk_norm_list([
-        "iran", "iranieni", "bombard", "rusia", "ucraina", "zelenski", "putin",
-        "motorina", "motorină", "geografie",
-    ])
-    return not any(kw in text for kw in blocked)
+def satire_ro_allow(title: str, summary: str, norm: Optional[str] = None) -> bool:
+    text = entry_text(title, summary, norm)
+    return not any(kw in text for kw in SATIRE_RO_BLOCK)
 
-def ro_positive_hits(title: str, summary: str, relaxed: bool = False) -> int:
-    text = normalize_text(f"{title} {summary}")
-    hits = sum(1 for kw in RO_POSITIVE_HINTS_STRICT if kw and kw in text)
+def ro_positive_hits(title: str, summary: str, relaxed: bool = False, norm: Optional[str] = None) -> int:
+    found = RO_POSITIVE_MATCHER.found(entry_text(title, summary, norm))
+    hits = sum(1 for kw in RO_POSITIVE_HINTS_STRICT if kw in found)
     if relaxed:
-        hits += sum(1 for kw in RO_POSITIVE_HINTS_RELAXED if kw and kw in text)
+        hits += sum(1 for kw in RO_POSITIVE_HINTS_RELAXED if kw in found)
     return hits
 
-def ro_mainstream_allow(title: str, summary: str) -> bool:
-    text = normalize_text(f"{title} {summary}")
-    return any(kw in text for kw in RO_MAINSTREAM_POSITIVE_GATE if kw)
+def ro_mainstream_allow(title: str, summary: str, norm: Optional[str] = None) -> bool:
+    text = entry_text(title, summary, norm)
+    return RO_MAINSTREAM_GATE_MATCHER.matches(text)
 
 def is_satire_source(source_name: str, link: str) -> bool:
     name = (source_name or "").lower()
@@ -658,9 +1129,9 @@ PROMO_HINTS = _mk_norm_list([
     "oferta", "ofertă", "reclama", "reclamă",
 ])
 
-def is_promotional_item(title: str, summary: str) -> bool:
-    text = normalize_text(f"{title} {summary}")
-    if any(kw in text for kw in PROMO_HINTS if kw):
+def is_promotional_item(title: str, summary: str, norm: Optional[str] = None) -> bool:
+    text = entry_text(title, summary, norm)
+    if any(kw in text for kw in PROMO_HINTS):
         return True
     raw = f"{title} {summary}".lower()
     return bool(PROMO_TAG_RE.search(raw))
@@ -685,10 +1156,11 @@ HEROIC_HINTS = _mk_norm_list([
     "operatie reusita", "operație reușită", "miracol", "salvamont", "descarcerare",
     "interventie reusita", "intervenție reușită", "copil recuperat", "adoptie reusita", "adopție reușită",
 ])
+FUN_OR_HERO_HINTS = FUNNY_HINTS + HEROIC_HINTS
 
 def is_fun_or_hero_item(item: Dict[str, Any]) -> bool:
     text = normalize_text(f"{item.get('title','')} {item.get('summary','')} {item.get('source','')}")
-    return any(kw in text for kw in FUNNY_HINTS + HEROIC_HINTS if kw)
+    return any(kw in text for kw in FUN_OR_HERO_HINTS)
 
 def apply_fun_boost(items: List[Dict[str, Any]], top_k: int = 20, max_boost: int = 4, min_satire: int = 2) -> List[Dict[str, Any]]:
     if not items:
@@ -775,32 +1247,26 @@ RAW_GLOBAL_POSITIVE = [
 GLOBAL_HARD_NEG = _mk_norm_list(RAW_GLOBAL_HARD_NEG)
 GLOBAL_SOFT_NEG = _mk_norm_list(RAW_GLOBAL_SOFT_NEG)
 GLOBAL_POSITIVE = _mk_norm_list(RAW_GLOBAL_POSITIVE)
+GLOBAL_RESEARCH_BOOST = _mk_norm_list(["study", "trial", "researchers", "clinical", "peer-reviewed", "meta-analysis"])
+GLOBAL_ENVIRONMENT_BOOST = _mk_norm_list(["renewable", "solar", "wind", "reforestation", "conservation", "restoration", "recycling"])
+GLOBAL_MATCHER = KeywordMatcher(
+    GLOBAL_HARD_NEG + GLOBAL_SOFT_NEG + GLOBAL_POSITIVE + GLOBAL_RESEARCH_BOOST + GLOBAL_ENVIRONMENT_BOOST
+)
+
+def score_global(section_id: str, title: str, summary: str, norm: Optional[str] = None) -> int:
+    found = GLOBAL_MATCHER.found(entry_text(title, summary, norm))
+    if not found:
+        return 0
 
-def score_global(section_id: str, title: str, summary: str) -> int:
-    text = normalize_text(f"{title} {summary}")
-
-    for kw in GLOBAL_HARD_NEG:
-        if kw and kw in text:
-            return -999
-
-    score = 0
-    for kw in GLOBAL_POSITIVE:
-        if kw and kw in text:
-            score += 2
+    if any(kw in found for kw in GLOBAL_HARD_NEG):
+        return -999
 
+    score = 2 * sum(1 for kw in GLOBAL_POSITIVE if kw in found)
     if section_id in ("medical", "science"):
-        for kw in _mk_norm_list(["study", "trial", "researchers", "clinical", "peer-reviewed", "meta-analysis"]):
-            if kw and kw in text:
-                score += 1
-
+        score += sum(1 for kw in GLOBAL_RESEARCH_BOOST if kw in found)
     if section_id == "environment":
-        for kw in _mk_norm_list(["renewable", "solar", "wind", "reforestation", "conservation", "restoration", "recycling"]):
-            if kw and kw in text:
-                score += 1
-
-    for kw in GLOBAL_SOFT_NEG:
-        if kw and kw in text:
-            score -= 1
+        score += sum(1 for kw in GLOBAL_ENVIRONMENT_BOOST if kw in found)
+    score -= sum(1 for kw in GLOBAL_SOFT_NEG if kw in found)
 
     return score
 
@@ -816,22 +1282,24 @@ JOKES_FALLBACK = [
 ]
 
 def load_jokes_from_file(path: str) -> List[str]:
-    if not os.path.exists(path):
+    try:
+        with open(path, "rb") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
         return []
 
     jokes: List[str] = []
     seen = set()
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            t = line.strip()
-            t = re.sub(r"^\s*[-*•]+\s*", "", t)
-            if not t or t.startswith("#") or len(t) < 12:
-                continue
-            key = normalize_text(t)
-            if key in seen:
-                continue
-            seen.add(key)
-            jokes.append(t)
+    for line in lines:
+        t = line.decode("utf-8", errors="ignore").strip()
+        t = JOKE_BULLET_RE.sub("", t)
+        if not t or t.startswith("#") or len(t) < 12:
+            continue
+        key = normalize_text(t)
+        if key in seen:
+            continue
+        seen.add(key)
+        jokes.append(t)
     return jokes
 
 SATIRE_FALLBACK = [
@@ -848,7 +1316,7 @@ def build_joke() -> Dict[str, Any]:
     day = now_utc.strftime("%Y-%m-%d")
     slot = now_utc.hour // 6  # rotate every 6 hours
     seed = f"{day}-{slot}"
-    idx = int(hashlib.sha1(seed.encode("utf-8")).hexdigest(), 16) % len(jokes)
+    idx = stable_index(seed, len(jokes))
     source = "data/jokes_ro.txt" if jokes is not JOKES_FALLBACK else "fallback"
     return {"date_utc": day, "text": jokes[idx], "source": source}
 
@@ -866,7 +1334,7 @@ def build_satire() -> Dict[str, Any]:
             return {"title": title, "link": link, "source": "timesnewroman.ro"}
     # fallback local
     day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    idx = int(hashlib.sha1(("satire-" + day).encode("utf-8")).hexdigest(), 16) % len(SATIRE_FALLBACK)
+    idx = stable_index("satire-" + day, len(SATIRE_FALLBACK))
     item = SATIRE_FALLBACK[idx]
     return {"title": item["title"], "link": item["link"], "source": "fallback"}
 
@@ -998,9 +1466,11 @@ def _top_tag_feeds(tag: str) -> List[str]:
 def _fetch_top_tag_candidates(tag: str) -> List[str]:
     out: List[str] = []
     seen = set()
-    for url in _top_tag_feeds(tag):
+    urls = _top_tag_feeds(tag)
+    fetched = fetch_rss_many(urls)
+    for url in urls:
         try:
-            f = fetch_rss(url)
+            f = fetched.get(url) or fetch_rss(url)
             entries = list((f.entries or [])[:120])
             random.shuffle(entries)
             for e in entries:
@@ -1020,15 +1490,19 @@ def _fetch_top_tag_candidates(tag: str) -> List[str]:
             continue
     return out
 
+def _slot_choice(state: Dict[str, Any], slot: int, tag: str) -> str:
+    existing_slot = (state.get("chosen_by_slot") or {}).get(str(slot))
+    if isinstance(existing_slot, dict):
+        return (existing_slot.get(tag) or "").strip()
+    return ""
+
 def _pick_unique_for_slot(tag: str, slot: int, state: Dict[str, Any], history: Dict[str, List[str]]) -> Optional[str]:
     slot_key = str(slot)
     chosen_by_slot = state.get("chosen_by_slot") or {}
     used_by_tag = state.get("used_by_tag") or {}
-    existing_slot = chosen_by_slot.get(slot_key)
-    if isinstance(existing_slot, dict):
-        url = (existing_slot.get(tag) or "").strip()
-        if url:
-            return url
+    url = _slot_choice(state, slot, tag)
+    if url:
+        return url
 
     used_list = used_by_tag.get(tag)
     if not isinstance(used_list, list):
@@ -1148,6 +1622,13 @@ def pick_flickr_images(limit: int = 3, prev_payload: Optional[Dict[str, Any]] =
         ("microcosmos", "https://www.flickr.com/services/feeds/photos_public.gne?format=rss2&tags=microscopy,micrograph,cell,bacteria&tagmode=all"),
     ]
 
+    # Toate feed-urile Flickr necesare in slotul curent se descarca intr-un singur pool:
+    # cele per tag + feed-urile tag-urilor statice inca nealese (raman in memo-ul fetch_rss).
+    fetched = fetch_rss_many(
+        [url for tag, url in feeds if tag not in STATIC_TOP_TAGS]
+        + [u for tag in sorted(STATIC_TOP_TAGS) if not _slot_choice(top_state, slot, tag) for u in _top_tag_feeds(tag)]
+    )
+
     out: List[Dict[str, Any]] = []
     for tag, url in feeds:
         recent = history.get(tag, [])
@@ -1163,7 +1644,7 @@ def pick_flickr_images(limit: int = 3, prev_payload: Optional[Dict[str, Any]] =
                 _update_history(history, tag, picked)
             continue
         try:
-            f = fetch_rss(url)
+            f = fetched.get(url) or fetch_rss(url)
             if not f.entries:
                 raise RuntimeError("empty feed")
             entries = list(f.entries[:60])
@@ -1261,11 +1742,7 @@ def build_mix_items(
             j += 1
 
     leftovers = ro_tail[i:] + en[j:]
-    leftovers.sort(key=lambda x: x.get("published_utc", ""), reverse=True)
-    for it in leftovers:
-        if len(out) >= max_items:
-            break
-        out.append(it)
+    out.extend(heapq.nlargest(max(0, max_items - len(out)), leftovers, key=lambda x: x.get("published_utc", "")))
 
     return apply_fun_boost(out, top_k=fun_boost_top_k, max_boost=fun_boost_max, min_satire=min_satire)
 
@@ -1432,6 +1909,7 @@ def build_sections(
     cfg: Dict[str, Any],
     published_state: Optional[Dict[str, Dict[str, str]]] = None,
     publish_cooldown_override: Optional[int] = None,
+    translation_cache: Optional[Dict[str, Dict[str, Any]]] = None,
 ) -> Dict[str, List[Dict[str, Any]]]:
     rss_sources = cfg.get("rss_sources") or {}
     sections_def = cfg.get("sections") or []
@@ -1456,18 +1934,33 @@ def build_sections(
     seen_titles: set = set()
     ro_candidates: List[Dict[str, Any]] = []
 
+    feeds = fetch_rss_many([
+        (src.get("url") or "").strip()
+        for sources in rss_sources.values()
+        for src in (sources or [])
+    ])
+
     for section_id, sources in rss_sources.items():
         items: List[Dict[str, Any]] = []
+        entry_of: Dict[int, Tuple[Any, str]] = {}
+        section_max = max_items_map.get(section_id, 20)
+        kind = "ro" if section_id == "romania" else "global"
+        thr = int(thresholds.get(section_id, 0))
+        if kind == "global":
+            # Keep global constructive articles even when they score neutral.
+            thr = min(thr, 0)
 
         for src in sources:
             name = src.get("name", section_id)
             url = (src.get("url") or "").strip()
             if not url:
                 continue
-            cap = source_item_cap(section_id, name)
+            # Peste section_max iteme de la aceeasi sursa nu pot supravietui trunchierii.
+            cap = min(source_item_cap(section_id, name), section_max)
             kept_from_source = 0
+            satire_source = is_satire_source(name, url) if kind == "ro" else False
 
-            feed = fetch_rss(url)
+            feed = feeds.get(url) or fetch_rss(url)
             entries = list((feed.entries or [])[:90])
             if is_satire_source(name, url):
                 random.shuffle(entries)
@@ -1480,40 +1973,54 @@ def build_sections(
                     continue
 
                 link = canonicalize_url(link)
+                key = dedupe_key(link, title)
+                title_key = normalized_title_key(title)
+                # Dedupe-ul nu depinde de scor: articolele deja acceptate (in orice sectiune,
+                # inclusiv cele taiate apoi la trunchiere) se sar inainte de rezumat/scoring
+                # si nu mai ajung nici in ro_candidates pentru fallback-ul relaxat.
+                if key in seen or title_key in seen_titles:
+                    continue
+                # Cooldown-ul se poate verifica devreme doar la global: la RO articolele
+                # respinse strict ajung in ro_candidates (fallback fara cooldown).
+                if kind == "global" and is_recently_published(
+                    published_state, key, title_key, publish_cooldown_days, now_utc
+                ):
+                    continue
                 summary = get_entry_summary(e)
-                if is_promotional_item(title, summary):
+                norm = normalize_text(f"{title} {summary}")
+                if is_promotional_item(title, summary, norm=norm):
                     continue
                 dt = parse_entry_datetime(e)
                 published = (dt or datetime.now(timezone.utc)).replace(microsecond=0)
 
-                kind = "ro" if section_id == "romania" else "global"
-                satire_source = is_satire_source(name, url) if kind == "ro" else False
-
                 if kind == "ro":
                     if satire_source:
                         # Satire is intentionally allowed to keep variety in mix.
-                        if not satire_ro_allow(title, summary):
+                        if not satire_ro_allow(title, summary, norm=norm):
                             continue
                         score = 3
                     else:
-                        if ro_low_signal_block(title, summary, name):
+                        # Blocajul dur respinge oricum articolul (si din fallback-ul relaxat).
+                        if ro_hard_block(title, summary, norm=norm):
+                            continue
+                        if ro_low_signal_block(title, summary, name, norm=norm):
                             continue
-                        if name in {"Salvamont Romania"} and not ro_mainstream_allow(title, summary):
+                        if name in {"Salvamont Romania"} and not ro_mainstream_allow(title, summary, norm=norm):
                             continue
-                        strict_hits = ro_positive_hits(title, summary, relaxed=False)
-                        if name in MAINSTREAM_RO_SOURCES and strict_hits < 1 and not ro_mainstream_allow(title, summary):
+                        strict_hits = ro_positive_hits(title, summary, relaxed=False, norm=norm)
+                        if name in MAINSTREAM_RO_SOURCES and strict_hits < 1 and not ro_mainstream_allow(title, summary, norm=norm):
                             continue
                         if ro_max_age_days > 0:
                             age_days = (now_utc - published).days
                             if age_days > ro_max_age_days:
                                 continue
-                        curated_relaxed_ok = name in CURATED_RO_SOURCES and ro_curated_allow(title, summary)
-                        source_native_ok = name in SOURCE_NATIVE_POSITIVE_RO and ro_source_native_allow(title, summary)
-                        if not ro_allow(title, summary, relaxed=False) and not curated_relaxed_ok and not source_native_ok:
-                            if ro_try_relaxed and not ro_hard_block(title, summary):
-                                relaxed_hits = ro_positive_hits(title, summary, relaxed=True)
+                        curated_relaxed_ok = name in CURATED_RO_SOURCES and ro_curated_allow(title, summary, norm=norm)
+                        source_native_ok = name in SOURCE_NATIVE_POSITIVE_RO and ro_source_native_allow(title, summary, norm=norm)
+                        if not ro_allow(title, summary, relaxed=False, norm=norm) and not curated_relaxed_ok and not source_native_ok:
+                            if ro_try_relaxed:
+                                relaxed_hits = ro_positive_hits(title, summary, relaxed=True, norm=norm)
                                 if name in MAINSTREAM_RO_SOURCES:
-                                    if relaxed_hits < 2 or not ro_mainstream_allow(title, summary):
+                                    if relaxed_hits < 2 or not ro_mainstream_allow(title, summary, norm=norm):
                                         continue
                                 elif name in CURATED_RO_SOURCES and relaxed_hits < 1:
                                     continue
@@ -1530,21 +2037,15 @@ def build_sections(
                             continue
                         score = 3
                 else:
-                    score = score_global(section_id, title, summary)
+                    score = score_global(section_id, title, summary, norm=norm)
                     if score < 0:
                         continue
 
-                thr = int(thresholds.get(section_id, 0))
-                if kind == "global":
-                    # Keep global constructive articles even when they score neutral.
-                    thr = min(thr, 0)
                 if score < thr:
                     continue
 
-                key = dedupe_key(link, title)
                 if key in seen:
                     continue
-                title_key = normalized_title_key(title)
                 if title_key in seen_titles:
                     continue
                 cooldown_exempt = satire_source or (kind == "ro" and name in SOURCE_NATIVE_POSITIVE_RO)
@@ -1567,25 +2068,22 @@ def build_sections(
                 if is_satire_source(name, link):
                     item["title"] = f"😂 {item['title']}"
 
-                img = extract_image_url(e)
-                item["image"] = img or fallback_image_url(section_id, title, link)
-
-                if kind == "global":
-                    tr_title = deepl_translate(title) or None
-                    tr_sum = deepl_translate(summary) or None
-                    if tr_title:
-                        item["title_ro"] = tr_title
-                    if tr_sum:
-                        item["summary_ro"] = tr_sum
-
                 items.append(item)
+                entry_of[id(item)] = (e, title)
                 mark_published(published_state, key, title_key, now_utc.replace(microsecond=0).isoformat())
                 kept_from_source += 1
 
-        items.sort(key=lambda x: x.get("published_utc", ""), reverse=True)
-        items = items[: max_items_map.get(section_id, 20)]
+        # published_utc e ISO-8601 => ordonarea lexicografica e cronologica.
+        items = heapq.nlargest(section_max, items, key=lambda x: x.get("published_utc", ""))
+        # Imaginea se cauta doar pentru articolele ramase dupa trunchiere.
+        for it in items:
+            e, raw_title = entry_of[id(it)]
+            it["image"] = extract_image_url(e) or fallback_image_url(section_id, raw_title, it["link"])
         out[section_id] = items
 
+    # Traducem doar ce ramane dupa trunchiere, pentru toate sectiunile deodata.
+    translate_global_items([it for items in out.values() for it in items], cache=translation_cache)
+
     # Relaxed RO fallback
     if "romania" in out and ro_try_relaxed and len(out["romania"]) < ro_min_items:
         needed = ro_min_items - len(out["romania"])
@@ -1613,8 +2111,9 @@ def build_sections(
             mark_published(published_state, k, title_key, now_utc.replace(microsecond=0).isoformat())
             added += 1
 
-        out["romania"].sort(key=lambda x: x.get("published_utc", ""), reverse=True)
-        out["romania"] = out["romania"][: max_items_map.get("romania", 40)]
+        out["romania"] = heapq.nlargest(
+            max_items_map.get("romania", 40), out["romania"], key=lambda x: x.get("published_utc", "")
+        )
 
     return out
 
@@ -1623,12 +2122,25 @@ def build_sections(
 # -----------------------------
 def main() -> None:
     cfg = load_yaml(CONFIG_PATH)
+    prev = read_json(OUT_NEWS)
+    # Imaginile de top (feed-uri Flickr) nu depind de sectiuni: le descarcam in fundal
+    # cat timp se construiesc sectiunile.
+    images_pool = ThreadPoolExecutor(max_workers=1)
+    top_images_future = images_pool.submit(
+        pick_flickr_images, limit=3, prev_payload=prev if isinstance(prev, dict) else None
+    )
     published_state = load_published_state(PUBLISHED_STATE_PATH)
-    sections = build_sections(cfg, published_state=published_state)
+    translation_cache = load_translation_cache(DEEPL_CACHE_PATH)
+    sections = build_sections(cfg, published_state=published_state, translation_cache=translation_cache)
     total_items = sum(len(v or []) for v in (sections or {}).values())
     if total_items == 0:
         retry_state = load_published_state(PUBLISHED_STATE_PATH)
-        sections = build_sections(cfg, published_state=retry_state, publish_cooldown_override=0)
+        sections = build_sections(
+            cfg,
+            published_state=retry_state,
+            publish_cooldown_override=0,
+            translation_cache=translation_cache,
+        )
         retry_total = sum(len(v or []) for v in (sections or {}).values())
         if retry_total > 0:
             published_state = retry_state
@@ -1646,7 +2158,6 @@ def main() -> None:
     mix_fun_max = int(mix_cfg.get("fun_boost_max", 2))
     mix_min_satire = int(mix_cfg.get("min_satire", 1))
 
-    prev = read_json(OUT_NEWS)
     prev_sections = prev.get("sections") if isinstance(prev, dict) else {}
     if isinstance(prev_sections, dict):
         prev_sections = {k: normalize_legacy_fallback_items(list(v or [])) for k, v in prev_sections.items()}
@@ -1744,7 +2255,8 @@ def main() -> None:
             )
             print("[WARN] EN floor restore applied from previous snapshot")
 
-    top_images, top_image_history = pick_flickr_images(limit=3, prev_payload=prev if isinstance(prev, dict) else None)
+    top_images, top_image_history = top_images_future.result()
+    images_pool.shutdown()
 
     payload: Dict[str, Any] = {
         "generated_utc": utc_now_iso(),
@@ -1756,8 +2268,12 @@ def main() -> None:
         "top_image_history": top_image_history,
     }
     write_json(PUBLISHED_STATE_PATH, prune_published_state(published_state))
+    write_json(DEEPL_CACHE_PATH, prune_translation_cache(translation_cache))
+    prune_http_cache()
     write_json(OUT_NEWS, payload)
-    write_json(OUT_ITEMS, payload)
+    # items.json e acelasi payload: copiem fisierul in loc sa serializam din nou (tot atomic)
+    shutil.copyfile(OUT_NEWS, OUT_ITEMS + ".tmp")
+    os.replace(OUT_ITEMS + ".tmp", OUT_ITEMS)
     print("[OK] wrote data/news.json and data/items.json")
 
 if __name__ == "__main__":